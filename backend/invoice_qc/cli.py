@@ -7,39 +7,136 @@ Commands:
 - full-run   → extract + validate in one go
 """
 
-import json
+import heapq
+from enum import Enum
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .extractor import PDFInvoiceExtractor
-from .validator import InvoiceValidator
-from .models import Invoice
+# extractor / validator are imported inside the helpers that use them, so
+# commands that don't need them (and --help) start faster
+from .models import (
+    INVOICE_ADAPTER,
+    INVOICE_LIST_ADAPTER,
+    Invoice,
+    ValidationReport,
+    ValidationResult,
+)
 
 app = typer.Typer(help="Invoice QC - extract and validate invoices from PDFs")
 console = Console()
 
+# Above this many invoices the results table only shows the first failures
+MAX_TABLE_ROWS = 100
+TRUNCATED_TABLE_ROWS = 50
+
+# Sort key for (rule, count) pairs
+_by_count = itemgetter(1)
+
+
+class InvoiceFormat(str, Enum):
+    """File format for invoice data: one JSON array, or JSON Lines (one invoice per line)."""
+    json = "json"
+    jsonl = "jsonl"
+
 
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
-def _extract_from_directory(pdf_dir: Path) -> List[Invoice]:
-    """Loop through all PDFs in a folder and extract them into Invoice objects."""
-    extractor = PDFInvoiceExtractor()
-    invoices: List[Invoice] = []
+def _write_json(path: Path, payload: bytes) -> None:
+    """Write already-serialized JSON bytes, creating the parent folder if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+
+
+def _write_invoices(path: Path, invoices: List[Invoice], fmt: InvoiceFormat) -> None:
+    """Save invoices as a JSON array or as JSON Lines (same writer as fast_cli)."""
+    from .extractor import write_invoices
+
+    write_invoices(path, invoices, jsonl=fmt is InvoiceFormat.jsonl)
+
+
+def _read_invoices(path: Path, fmt: InvoiceFormat) -> List[Invoice]:
+    """Load invoices from a JSON array, or line by line from a JSON Lines file."""
+    if fmt is InvoiceFormat.json:
+        return INVOICE_LIST_ADAPTER.validate_json(path.read_bytes())
+
+    with path.open("rb") as f:
+        return [INVOICE_ADAPTER.validate_json(line) for line in f if line.strip()]
+
+
+def _extract_from_directory(pdf_dir: Path, cache_dir: Optional[Path] = None) -> List[Invoice]:
+    """Extract all PDFs in a folder into Invoice objects, reporting failures."""
+
+    from .extractor import extract_directory
+
+    def _report(pdf_path: str, exc: Exception) -> None:
+        console.print(f"[red]Failed to extract {Path(pdf_path).name}: {exc}[/red]")
+
+    return extract_directory(str(pdf_dir), on_error=_report, cache_dir=cache_dir)
+
+
+def _validate_invoices(invoices: List[Invoice], workers: int = 1) -> Dict:
+    """
+    Validate invoices, in this process unless workers > 1.
+
+    With workers > 1 (0 = one per CPU) large batches are split into chunks
+    and validated on a process pool; the per-chunk error counts are merged
+    into one summary (see InvoiceValidator.validate_batch).
+    """
+    from .validator import InvoiceValidator
+
+    return InvoiceValidator().validate_batch(invoices, workers=workers or None)
+
+
+def _print_results(
+    results: List[ValidationResult], max_rules: int, title: Optional[str] = None
+) -> None:
+    """
+    Print per-invoice results as a Rich table.
+
+    Large batches only list the first failures (rendering thousands of rows is
+    slow and unreadable), and when stdout isn't a terminal (CI logs, pipes)
+    plain tab-separated lines are printed instead of a table.
+    """
+    rows = results
+    hidden = 0
+    if len(results) > MAX_TABLE_ROWS:
+        rows = [r for r in results if not r.is_valid][:TRUNCATED_TABLE_ROWS]
+        hidden = len(results) - len(rows)
+
+    def _error_rules(r: ValidationResult) -> str:
+        error_rules = ", ".join(e.rule for e in r.errors[:max_rules])
+        if len(r.errors) > max_rules:
+            error_rules += f" (+{len(r.errors) - max_rules})"
+        return error_rules
+
+    if not console.is_terminal:
+        print("invoice_id\tstatus\terrors")
+        for r in rows:
+            print(f"{r.invoice_id}\t{'PASS' if r.is_valid else 'FAIL'}\t{_error_rules(r)}")
+        if hidden:
+            print(f"...and {hidden} more")
+        return
+
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    table.add_column("Invoice ID", style="cyan", width=20)
+    table.add_column("Status", width=10)
+    table.add_column("Errors (first few)", style="yellow")
 
-    for pdf_path in sorted(pdf_dir.glob("*.pdf")):
-        try:
-            inv = extractor.extract(str(pdf_path))
-            invoices.append(inv)
-        except Exception as exc:
-            console.print(f"[red]Failed to extract {pdf_path.name}: {exc}[/red]")
+    for r in rows:
+        status = "[green]PASS[/green]" if r.is_valid else "[red]FAIL[/red]"
+        table.add_row(r.invoice_id, status, _error_rules(r))
 
-    return invoices
+    if hidden:
+        table.add_row("…", "", f"and {hidden} more")
+
+    console.print(table)
 
 
 # ----------------------------------------------------------------------
@@ -53,6 +150,14 @@ def extract(
         "--output",
         help="Where to write the extracted JSON",
     ),
+    cache_dir: Optional[Path] = typer.Option(
+        None, "--cache-dir", help="Reuse extraction results for unchanged PDFs from this folder"
+    ),
+    fmt: InvoiceFormat = typer.Option(
+        InvoiceFormat.json,
+        "--format",
+        help="Output format: json (array) or jsonl (one invoice per line)",
+    ),
 ):
     """
     Extract invoice data from all PDFs in a directory and save as JSON.
@@ -72,17 +177,10 @@ def extract(
         console=console,
     ) as progress:
         task = progress.add_task("Reading PDFs...", total=None)
-        invoices = _extract_from_directory(pdf_dir)
+        invoices = _extract_from_directory(pdf_dir, cache_dir)
         progress.update(task, completed=True)
 
-    output.parent.mkdir(parents=True, exist_ok=True)
-    with output.open("w", encoding="utf-8") as f:
-        json.dump(
-            [inv.model_dump(mode="json") for inv in invoices],
-            f,
-            indent=2,
-            default=str,
-        )
+    _write_invoices(output, invoices, fmt)
 
     console.print(f"[green]✓ Extracted {len(invoices)} invoices → {output}\n")
 
@@ -93,6 +191,16 @@ def validate(
     report: Path = typer.Option(
         "validation_report.json", "--report", help="Where to write the validation report"
     ),
+    fmt: InvoiceFormat = typer.Option(
+        InvoiceFormat.json,
+        "--format",
+        help="Input format: json (array) or jsonl (one invoice per line)",
+    ),    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=0,
+        help="Processes for validating large batches (over 1000 invoices); 0 = one per CPU",
+    ),
 ):
     """
     Validate a JSON file containing invoices.
@@ -104,30 +212,14 @@ def validate(
         console.print(f"[red]✗ File not found:[/red] {input}")
         raise typer.Exit(code=1)
 
-    with input.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    invoices = [Invoice(**inv) for inv in raw]
+    invoices = _read_invoices(input, fmt)
 
     console.print(f"\n[cyan]🔍 Validating {len(invoices)} invoices...[/cyan]\n")
 
-    validator = InvoiceValidator()
-    result = validator.validate_batch(invoices)
+    result = _validate_invoices(invoices, workers)
 
     # Pretty table
-    table = Table(title="Validation Results", show_header=True, header_style="bold magenta")
-    table.add_column("Invoice ID", style="cyan", width=20)
-    table.add_column("Status", width=10)
-    table.add_column("Errors (first few)", style="yellow")
-
-    for r in result["results"]:
-        status = "[green]PASS[/green]" if r.is_valid else "[red]FAIL[/red]"
-        error_rules = ", ".join(e.rule for e in r.errors[:3])
-        if len(r.errors) > 3:
-            error_rules += f" (+{len(r.errors) - 3})"
-        table.add_row(r.invoice_id, status, error_rules)
-
-    console.print(table)
+    _print_results(result["results"], max_rules=3, title="Validation Results")
 
     summary = result["summary"]
     console.print("\n[bold]Summary:[/bold]")
@@ -137,21 +229,12 @@ def validate(
 
     if summary.error_counts:
         console.print("\n[bold]Top errors:[/bold]")
-        for rule, count in sorted(summary.error_counts.items(), key=lambda x: -x[1])[:5]:
+        for rule, count in heapq.nlargest(5, summary.error_counts.items(), key=_by_count):
             console.print(f"  • {rule}: {count}")
 
     # Save raw report JSON
-    report.parent.mkdir(parents=True, exist_ok=True)
-    with report.open("w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "results": [r.model_dump(mode="json") for r in result["results"]],
-                "summary": result["summary"].model_dump(mode="json"),
-            },
-            f,
-            indent=2,
-            default=str,
-        )
+    report_model = ValidationReport(results=result["results"], summary=result["summary"])
+    _write_json(report, report_model.model_dump_json(indent=2).encode())
 
     console.print(f"\n[green]✓ Report saved to {report}[/green]\n")
 
@@ -168,6 +251,19 @@ def full_run(
     save_extracted: bool = typer.Option(
         False, "--save-extracted", help="If set, also save extracted JSON next to the report"
     ),
+    cache_dir: Optional[Path] = typer.Option(
+        None, "--cache-dir", help="Reuse extraction results for unchanged PDFs from this folder"
+    ),
+    fmt: InvoiceFormat = typer.Option(
+        InvoiceFormat.json,
+        "--format",
+        help="Format for --save-extracted: json or jsonl",
+    ),    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=0,
+        help="Processes for validating large batches (over 1000 invoices); 0 = one per CPU",
+    ),
 ):
     """
     Run the full pipeline in one command: extract from PDFs and validate.
@@ -189,43 +285,23 @@ def full_run(
         console=console,
     ) as progress:
         task = progress.add_task("Reading PDFs...", total=None)
-        invoices = _extract_from_directory(pdf_dir)
+        invoices = _extract_from_directory(pdf_dir, cache_dir)
         progress.update(task, completed=True)
 
     console.print(f"[green]✓ Extracted {len(invoices)} invoices[/green]\n")
 
     # Optionally save extracted JSON
     if save_extracted:
-        extracted_file = report.parent / "extracted_invoices.json"
-        extracted_file.parent.mkdir(parents=True, exist_ok=True)
-        with extracted_file.open("w", encoding="utf-8") as f:
-            json.dump(
-                [inv.model_dump(mode="json") for inv in invoices],
-                f,
-                indent=2,
-                default=str,
-            )
+        extracted_file = report.parent / f"extracted_invoices.{fmt.value}"
+        _write_invoices(extracted_file, invoices, fmt)
         console.print(f"[dim]Saved extracted data to {extracted_file}[/dim]\n")
 
     # Step 2: validate
     console.print("[cyan]Step 2/2: Validating invoices...[/cyan]\n")
 
-    validator = InvoiceValidator()
-    result = validator.validate_batch(invoices)
+    result = _validate_invoices(invoices, workers)
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Invoice ID", style="cyan", width=20)
-    table.add_column("Status", width=10)
-    table.add_column("Errors (first few)", style="yellow")
-
-    for r in result["results"]:
-        status = "[green]PASS[/green]" if r.is_valid else "[red]FAIL[/red]"
-        error_rules = ", ".join(e.rule for e in r.errors[:2])
-        if len(r.errors) > 2:
-            error_rules += f" (+{len(r.errors) - 2})"
-        table.add_row(r.invoice_id, status, error_rules)
-
-    console.print(table)
+    _print_results(result["results"], max_rules=2)
 
     summary = result["summary"]
     console.print("\n[bold cyan]=== Summary ===[/bold cyan]")
@@ -235,21 +311,12 @@ def full_run(
 
     if summary.error_counts:
         console.print("\n[bold]Top validation errors:[/bold]")
-        for rule, count in sorted(summary.error_counts.items(), key=lambda x: -x[1])[:5]:
+        for rule, count in heapq.nlargest(5, summary.error_counts.items(), key=_by_count):
             console.print(f"  • {rule}: {count}")
 
     # Save report
-    report.parent.mkdir(parents=True, exist_ok=True)
-    with report.open("w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "results": [r.model_dump(mode="json") for r in result["results"]],
-                "summary": result["summary"].model_dump(mode="json"),
-            },
-            f,
-            indent=2,
-            default=str,
-        )
+    report_model = ValidationReport(results=result["results"], summary=result["summary"])
+    _write_json(report, report_model.model_dump_json(indent=2).encode())
 
     console.print(f"\n[green]✓ Validation report saved to {report}[/green]\n")
 
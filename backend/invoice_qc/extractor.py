@@ -8,12 +8,40 @@ I kept this module fairly simple on purpose:
 - return structured data that matches the Invoice model
 """
 
+import hashlib
+import os
 import re
-import pdfplumber
-from datetime import datetime
-from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timezone
+from itertools import chain, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, List
 
-from .models import Invoice, LineItem
+from .models import INVOICE_ADAPTER, INVOICE_LIST_ADAPTER, Invoice, LineItem
+
+
+# Optional sign followed by digits and "." / "," separators
+_NUMBER_RE = re.compile(r"([-+]?)([\d.,]+)")
+
+# Cheap hint that the text contains a line-item row: three numbers in a row
+# (qty, unit price, line total), e.g. "Widget 2 25.00 50.00"
+_TABLE_ROW_RE = re.compile(r"\d[\d.,]*[ \t]+\d[\d.,]*[ \t]+\d[\d.,]*")
+
+# Gaps (in PDF points) that start a new line / word when rebuilding page text
+_X_TOLERANCE = 3
+_Y_TOLERANCE = 3
+
+# Mixed into the cache key; bump it whenever extraction logic changes so
+# results from an older extractor are not served from the cache
+CACHE_VERSION = b"extract-v2"
+
+# Folders with at most this many PDFs are extracted in-process: starting a
+# process pool costs more than parsing one or two files
+SERIAL_MAX_FILES = 2
+
+# Fallback formats for _parse_date (tried in order)
+_DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y")
 
 
 class PDFInvoiceExtractor:
@@ -22,20 +50,24 @@ class PDFInvoiceExtractor:
     The extraction logic is intentionally lightweight because invoice layouts vary a lot.
     """
 
-    # Basic regex patterns for fields commonly found in invoices
+    # Compiled once per class; group 2 holds the value
     FIELD_PATTERNS = {
-        "invoice_number": r"(Invoice Number|Invoice No\.?|Rechnung\s*Nr\.?)[:\s]*([\w\-\/]+)",
-        "invoice_date": r"(Invoice Date|Rechnungsdatum)[:\s]*([\d\.\-/]+)",
-        "due_date": r"(Due Date|Faelligkeitsdatum)[:\s]*([\d\.\-/]+)",
-        "net_total": r"(Net Total|Netto)[:\s]*([\d\.,]+)",
-        "tax_amount": r"(Tax Amount|MwSt)[:\s]*([\d\.,]+)",
-        "gross_total": r"(Total|Gesamtbetrag|Brutto)[:\s]*([\d\.,]+)",
-        "seller_name": r"(From|Seller|Lieferant)[:\s]*(.*)",
-        "buyer_name": r"(To|Buyer|Kunde)[:\s]*(.*)",
+        key: re.compile(pattern, re.IGNORECASE)
+        for key, pattern in {
+            "invoice_number": r"(Invoice Number|Invoice No\.?|Rechnung\s*Nr\.?)[:\s]*([\w\-\/]+)",
+            "invoice_date": r"(Invoice Date|Rechnungsdatum)[:\s]*([\d\.\-/]+)",
+            "due_date": r"(Due Date|Faelligkeitsdatum)[:\s]*([\d\.\-/]+)",
+            "net_total": r"(Net Total|Netto)[:\s]*([\d\.,]+)",
+            "tax_amount": r"(Tax Amount|MwSt)[:\s]*([\d\.,]+)",
+            "gross_total": r"(Total|Gesamtbetrag|Brutto)[:\s]*([\d\.,]+)",
+            "seller_name": r"(From|Seller|Lieferant)[:\s]*(.*)",
+            "buyer_name": r"(To|Buyer|Kunde)[:\s]*(.*)",
+        }.items()
     }
 
-    def __init__(self):
-        pass
+    def __init__(self, cache_dir: Optional[Path] = None):
+        # Optional content-addressed cache of extracted invoices (one JSON per PDF hash)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     # ------------------------------------------------------------------
     # Main entry point
@@ -44,11 +76,40 @@ class PDFInvoiceExtractor:
         """
         Extracts invoice data from a PDF file and returns an Invoice model.
         Not all fields will be present—any missing fields will fall back to None.
+
+        If a cache_dir is set, results are cached by the hash of the PDF bytes
+        (and CACHE_VERSION), so unchanged files are not parsed again on later runs.
         """
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self.cache_dir / f"{self._file_digest(pdf_path)}.json"
+            cached = self._read_cache(cache_file)
+            if cached is not None:
+                # same content may live under a different name/path now
+                return cached.model_copy(
+                    update={"source_file": pdf_path, "extracted_at": datetime.now(timezone.utc)}
+                )
+
+        # pdfplumber (and pdfminer under it) is slow to import, so it's only
+        # loaded once we actually read a PDF, not when the module is imported.
+        import pdfplumber
+
+        # Open the PDF once: pdfplumber parses the document on open, so text
+        # and tables are both pulled from the same page objects.
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                text = self._read_pdf_text(pdf)
+                # Table detection is the most expensive step, so only run it
+                # when the text has something that looks like a line-item row.
+                if _TABLE_ROW_RE.search(text):
+                    line_items = self._extract_line_items(pdf)
+                else:
+                    line_items = []
+        except Exception as e:
+            print(f"Failed to read PDF: {e}")
+            text, line_items = "", []
 
-        text = self._read_pdf_text(pdf_path)
         parsed = self._extract_basic_fields(text)
-        line_items = self._extract_line_items(pdf_path)
 
         # Combine everything into a structured Invoice object
         invoice = Invoice(
@@ -72,20 +133,79 @@ class PDFInvoiceExtractor:
             source_file=pdf_path,
         )
 
+        if cache_file is not None:
+            self._write_cache(cache_file, invoice)
+
         return invoice
 
     # ------------------------------------------------------------------
-    # PDF → text
+    # Extraction cache
     # ------------------------------------------------------------------
-    def _read_pdf_text(self, pdf_path: str) -> str:
-        """Reads all text from a PDF using pdfplumber."""
+    def _file_digest(self, pdf_path: str) -> str:
+        """Content hash of the PDF (renaming/moving the file keeps the same key)."""
+        return hashlib.blake2b(
+            Path(pdf_path).read_bytes(), digest_size=20, person=CACHE_VERSION
+        ).hexdigest()
+
+    def _read_cache(self, cache_file: Path) -> Optional[Invoice]:
+        """Load a cached invoice, or None if missing/unreadable."""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-            return full_text
+            return INVOICE_ADAPTER.validate_json(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            print(f"Failed to read PDF: {e}")
-            return ""
+            print(f"Ignoring bad cache entry {cache_file.name}: {e}")
+            return None
+
+    def _write_cache(self, cache_file: Path, invoice: Invoice) -> None:
+        """Write the serialized invoice atomically (temp file + rename)."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(INVOICE_ADAPTER.dump_json(invoice))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Failed to write cache entry {cache_file.name}: {e}")
+
+    # ------------------------------------------------------------------
+    # PDF → text
+    # ------------------------------------------------------------------
+    def _read_pdf_text(self, pdf) -> str:
+        """Reads all text from an already opened pdfplumber document."""
+        return "\n".join(self._page_text(page) for page in pdf.pages)
+
+    def _page_text(self, page) -> str:
+        """
+        Rebuild page text straight from the raw character stream.
+
+        page.extract_text() runs pdfplumber's full word/line clustering, which
+        we don't need for label regexes. Here chars are grouped into lines by
+        their top position (within _Y_TOLERANCE, like pdfplumber), each line is
+        read left to right, and a space is added where there is a horizontal
+        gap. Sorting matters: the content stream can draw a whole label column
+        before the value column, which is not the reading order.
+        """
+        lines: List[List[dict]] = []
+        line_top = None
+
+        for ch in sorted(page.chars, key=itemgetter("top")):
+            if line_top is None or ch["top"] - line_top > _Y_TOLERANCE:
+                lines.append([])
+            lines[-1].append(ch)
+            line_top = ch["top"]
+
+        text_lines = []
+        for line in lines:
+            parts: List[str] = []
+            prev = None
+            for ch in sorted(line, key=itemgetter("x0")):
+                if prev is not None and ch["x0"] - prev["x1"] > _X_TOLERANCE:
+                    parts.append(" ")
+                parts.append(ch["text"])
+                prev = ch
+            text_lines.append("".join(parts))
+
+        return "\n".join(text_lines)
 
     # ------------------------------------------------------------------
     # Regex-based field extraction
@@ -95,7 +215,7 @@ class PDFInvoiceExtractor:
         data = {}
 
         for key, pattern in self.FIELD_PATTERNS.items():
-            match = re.search(pattern, text, flags=re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 raw_value = match.group(2).strip()
                 data[key] = self._clean_value(key, raw_value)
@@ -114,73 +234,174 @@ class PDFInvoiceExtractor:
 
     def _parse_date(self, s: str):
         """Handles common date formats found on invoices."""
-        for fmt in ("%d.%m.%Y", "%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y"):
+        # Fast paths for the two most common layouts, skipping strptime
+        try:
+            if len(s) == 10 and s[2] == "." and s[5] == "." and (s[:2] + s[3:5] + s[6:]).isdigit():
+                return date(int(s[6:10]), int(s[3:5]), int(s[0:2]))  # 15.01.2024
+            if len(s) == 10 and s[4] == "-" and s[7] == "-":
+                return date.fromisoformat(s)  # 2024-01-15
+        except ValueError:
+            pass
+
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(s, fmt).date()
-            except:
+            except ValueError:
                 pass
         return None
 
     def _parse_number(self, s: str) -> float:
         """
         Convert currency formats to floats.
-        Handles: "1,234.56", "1.234,56" (German), "1234.56"
+        Handles: "1,234.56", "1.234,56" (German), "1234.56", "285,00", "1.234.567"
         """
-        cleaned = s.replace(" ", "")
+        match = _NUMBER_RE.fullmatch(s.replace(" ", ""))
+        if not match:
+            return 0.0
 
-        # Convert German style 1.234,56 → 1234.56
-        if "," in cleaned and "." in cleaned and cleaned.find(",") > cleaned.find("."):
-            cleaned = cleaned.replace(".", "").replace(",", ".")
+        sign, digits = match.groups()
+        # a trailing dot/comma is punctuation (end of sentence), not a separator
+        digits = digits.rstrip(".,")
 
-        # Convert 1.234 → 1.234 or 1234 depending on invoice style
-        cleaned = cleaned.replace(",", "")
+        # The last separator decides the format. A comma is the decimal mark
+        # if it follows a dot (1.234,56) or is the only one with 1-2 digits
+        # after it (285,00); several dots and no comma are German thousands
+        # (1.234.567). Otherwise commas are thousands separators (1,234.56).
+        comma, dot = digits.rfind(","), digits.rfind(".")
+        if comma > dot and (dot >= 0 or (digits.count(",") == 1 and len(digits) - comma <= 3)):
+            digits = digits.replace(".", "").replace(",", ".")
+        elif comma < 0 and digits.count(".") > 1:
+            digits = digits.replace(".", "")
+        else:
+            digits = digits.replace(",", "")
 
         try:
-            return float(cleaned)
-        except:
+            return float(sign + digits)
+        except ValueError:
+            # e.g. mixed-up separators like "1.2,3.4"
             return 0.0
 
     # ------------------------------------------------------------------
     # Line items extraction
     # ------------------------------------------------------------------
-    def _extract_line_items(self, pdf_path: str) -> List[LineItem]:
+    def _extract_line_items(self, pdf) -> List[LineItem]:
         """
-        Attempt to detect line item tables from PDF pages.
+        Attempt to detect line item tables from the pages of an opened PDF.
+        Stops at the first page that yields items.
         This is best-effort only and depends on how clean the PDF is.
         """
         items = []
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    tables = page.extract_tables()
-                    if not tables:
+            for page in pdf.pages:
+                tables = page.extract_tables()
+                if not tables:
+                    continue
+
+                for table in tables:
+                    # Expecting something like:
+                    # desc | qty | price | total
+                    if len(table[0]) < 4:
                         continue
 
-                    for table in tables:
-                        # Expecting something like:
-                        # desc | qty | price | total
-                        if len(table[0]) < 4:
-                            continue
+                    for row in table[1:]:
+                        try:
+                            desc = row[0].strip()
+                            qty = float(row[1].replace(",", "."))
+                            price = float(row[2].replace(",", "."))
+                            total = float(row[3].replace(",", "."))
 
-                        for row in table[1:]:
-                            try:
-                                desc = row[0].strip()
-                                qty = float(row[1].replace(",", "."))
-                                price = float(row[2].replace(",", "."))
-                                total = float(row[3].replace(",", "."))
-
-                                items.append(
-                                    LineItem(
-                                        description=desc,
-                                        quantity=qty,
-                                        unit_price=price,
-                                        line_total=total,
-                                    )
+                            items.append(
+                                LineItem(
+                                    description=desc,
+                                    quantity=qty,
+                                    unit_price=price,
+                                    line_total=total,
                                 )
-                            except:
-                                continue
+                            )
+                        except:
+                            continue
+
+                # Line items are almost always on one page; stop once we found them
+                if items:
+                    break
         except:
             pass
 
         return items
+
+
+# ----------------------------------------------------------------------
+# Directory extraction (shared by the CLIs)
+# ----------------------------------------------------------------------
+def _iter_pdf_paths(pdf_dir: str) -> Iterator[str]:
+    """Yield PDF paths in a folder as they are listed (os.scandir avoids extra stat calls)."""
+    with os.scandir(pdf_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf") and entry.is_file():
+                yield entry.path
+
+
+def _extract_one(pdf_path: str, cache_dir: Optional[Path] = None) -> Invoice:
+    """Worker for the process pool: extract a single PDF into an Invoice."""
+    return PDFInvoiceExtractor(cache_dir=cache_dir).extract(pdf_path)
+
+
+def extract_directory(
+    pdf_dir: str,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+    cache_dir: Optional[Path] = None,
+) -> List[Invoice]:
+    """
+    Extract all PDFs in a folder into Invoice objects.
+
+    PDF parsing is CPU-bound and independent per file, so the files are spread
+    over a small process pool (up to SERIAL_MAX_FILES files are extracted in
+    this process instead). Files are submitted while the folder is still
+    being scanned; results are sorted by filename once at the end.
+    Files that fail are skipped and reported through on_error(path, exc).
+    """
+    extracted: Dict[str, Invoice] = {}
+
+    pdf_paths = _iter_pdf_paths(pdf_dir)
+    first_paths = list(islice(pdf_paths, SERIAL_MAX_FILES + 1))
+
+    if len(first_paths) <= SERIAL_MAX_FILES:
+        extractor = PDFInvoiceExtractor(cache_dir=cache_dir)
+        for pdf_path in first_paths:
+            try:
+                extracted[pdf_path] = extractor.extract(pdf_path)
+            except Exception as exc:
+                if on_error is not None:
+                    on_error(pdf_path, exc)
+    else:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 6)) as executor:
+            futures = {
+                executor.submit(_extract_one, pdf_path, cache_dir): pdf_path
+                for pdf_path in chain(first_paths, pdf_paths)
+            }
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    extracted[pdf_path] = future.result()
+                except Exception as exc:
+                    if on_error is not None:
+                        on_error(pdf_path, exc)
+
+    return [extracted[pdf_path] for pdf_path in sorted(extracted)]
+
+
+def write_invoices(path: Path, invoices: List[Invoice], jsonl: bool = False) -> None:
+    """
+    Save extracted invoices as an indented JSON array, or as JSON Lines
+    (written one invoice at a time). None fields are left out either way.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not jsonl:
+        path.write_bytes(INVOICE_LIST_ADAPTER.dump_json(invoices, indent=2, exclude_none=True))
+        return
+
+    with path.open("wb") as f:
+        for inv in invoices:
+            f.write(inv.to_json() + b"\n")
@@ -0,0 +1,61 @@
+"""
+Lightweight extraction CLI for scripted / per-file use.
+
+The main CLI (cli.py) uses typer + rich, which is nice interactively but adds
+noticeable startup time. This entrypoint only uses argparse and plain prints,
+so it's cheap to call from watchers or CI jobs.
+
+Usage:
+  python -m invoice_qc.fast_cli --pdf-dir pdfs --output invoices.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="extract-fast",
+        description="Extract invoice data from all PDFs in a directory and save as JSON.",
+    )
+    parser.add_argument("--pdf-dir", type=Path, required=True, help="Directory containing PDF files")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("extracted_invoices.json"),
+        help="Where to write the extracted JSON",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Reuse extraction results for unchanged PDFs from this folder",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if not args.pdf_dir.is_dir():
+        print(f"Directory not found: {args.pdf_dir}", file=sys.stderr)
+        return 1
+
+    # Imported here so --help stays fast
+    from .extractor import extract_directory, write_invoices
+
+    def _report(pdf_path: str, exc: Exception) -> None:
+        print(f"Failed to extract {Path(pdf_path).name}: {exc}", file=sys.stderr)
+
+    invoices = extract_directory(str(args.pdf_dir), on_error=_report, cache_dir=args.cache_dir)
+
+    write_invoices(args.output, invoices)
+
+    print(f"Extracted {len(invoices)} invoices -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
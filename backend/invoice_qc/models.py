@@ -10,10 +10,34 @@ This is meant for general B2B invoices (multi-currency, with line items).
 """
 
 from typing import Optional, List
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from enum import Enum
+from functools import cached_property
+import math
+from operator import attrgetter
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
+
+
+def _now() -> datetime:
+    """Current UTC time (timezone-aware, replaces the deprecated datetime.utcnow)."""
+    return datetime.now(timezone.utc)
+
+
+# C-level attribute access for summing line items with map()
+_GET_LINE_TOTAL = attrgetter("line_total")
+
+
+def to_cents(amount: float) -> int:
+    """Money amount as integer cents (rounded), for exact comparisons."""
+    return int(round(amount * 100))
 
 
 class Currency(str, Enum):
@@ -42,8 +66,11 @@ class LineItem(BaseModel):
     line_total: float
     tax_rate: Optional[float] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
             "example": {
                 "description": "Consulting services",
                 "quantity": 10.0,
@@ -51,7 +78,13 @@ class LineItem(BaseModel):
                 "line_total": 1500.0,
                 "tax_rate": 19.0,
             }
-        }
+        },
+    )
+
+
+# Invoice cached_property names. Their values live in the instance __dict__,
+# which model_copy copies as-is, so Invoice.model_copy drops them.
+_INVOICE_CACHED_PROPERTIES = ("line_items_total",)
 
 
 class Invoice(BaseModel):
@@ -132,10 +165,27 @@ class Invoice(BaseModel):
         None, description="Original PDF filename (for traceability)"
     )
     extracted_at: Optional[datetime] = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now,
         description="When this invoice was parsed from PDF",
     )
 
+    def to_json(self) -> bytes:
+        """Compact JSON for this invoice (None fields are left out)."""
+        return self.model_dump_json(exclude_none=True).encode()
+
+    @computed_field
+    @cached_property
+    def line_items_total(self) -> float:
+        """Sum of line_total over all line items, computed once and included in dumps."""
+        return math.fsum(map(_GET_LINE_TOTAL, self.line_items))
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> "Invoice":
+        """model_copy that drops cached derived values so the copy recomputes them."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _INVOICE_CACHED_PROPERTIES:
+            copied.__dict__.pop(name, None)
+        return copied
+
     @field_validator("net_total", "tax_amount", "gross_total")
     @classmethod
     def non_negative_amounts(cls, v: float) -> float:
@@ -144,8 +194,14 @@ class Invoice(BaseModel):
             raise ValueError("Amounts cannot be negative")
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        # frozen so the cached line_items_total above can't
+        # go stale through field assignment
+        frozen=True,
+        validate_assignment=False,
+        str_strip_whitespace=False,  # the extractor already strips values
+        json_schema_extra={
             "example": {
                 "invoice_number": "INV-2024-001",
                 "external_reference": "PO-12345",
@@ -172,11 +228,24 @@ class Invoice(BaseModel):
                     }
                 ],
             }
-        }
+        },
+    )
+
+
+# Built once at import time so the pydantic core validator/serializer is reused
+# for every load/dump instead of being set up per call.
+INVOICE_ADAPTER = TypeAdapter(Invoice)
+INVOICE_LIST_ADAPTER = TypeAdapter(List[Invoice])
 
 
 class ValidationError(BaseModel):
-    """Represents a single validation problem found on an invoice."""
+    """
+    Represents a single validation problem found on an invoice.
+
+    Frozen, so the validator can share one instance between invoices.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     rule: str = Field(..., description="Identifier of the rule that failed")
     message: str = Field(..., description="Human-readable explanation of the issue")
@@ -213,6 +282,13 @@ class ValidationSummary(BaseModel):
         description="How many times each rule failed across all invoices",
     )
     validation_timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now,
         description="When this summary was generated",
     )
+
+
+class ValidationReport(BaseModel):
+    """Full report written by the CLI: per-invoice results plus the batch summary."""
+
+    results: List[ValidationResult] = Field(default_factory=list)
+    summary: ValidationSummary
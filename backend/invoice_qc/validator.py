@@ -12,16 +12,105 @@ Rules are grouped as:
 - a couple of anomaly-style checks
 """
 
-from typing import List, Dict
-from datetime import datetime, date
-from collections import defaultdict
+from typing import Iterator, List, Dict, FrozenSet, NamedTuple, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import date
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 import logging
-
-from .models import Invoice, ValidationError, ValidationResult, ValidationSummary
+import os
+
+from .models import (
+    _GET_LINE_TOTAL,
+    Currency,
+    Invoice,
+    ValidationError,
+    ValidationResult,
+    ValidationSummary,
+    to_cents,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# validate_batch(workers > 1) only uses a process pool above this many invoices
+PARALLEL_THRESHOLD = 1000
+MIN_CHUNK_SIZE = 256
+
+# Built once: list for messages, frozenset for O(1) membership checks
+_CURRENCY_VALUES: List[str] = [c.value for c in Currency]
+_ALLOWED_CURRENCIES: FrozenSet[str] = frozenset(_CURRENCY_VALUES)
+
+
+def _is_str_field(field_name: str) -> bool:
+    """True if the Invoice field is annotated as str (or a str subclass like Currency)."""
+    annotation = Invoice.model_fields[field_name].annotation
+    return isinstance(annotation, type) and issubclass(annotation, str)
+
+
+def _err(rule: str, message: str, severity: str = "error") -> ValidationError:
+    """
+    Build a ValidationError without running pydantic validation.
+
+    Every check produces these from known-good str values, so the field
+    validation done by the normal constructor is pure overhead on
+    error-heavy batches.
+    """
+    return ValidationError.model_construct(rule=rule, message=message, severity=severity)
+
+
+@lru_cache(maxsize=4096)
+def _mk_err(rule: str, message: str, severity: str = "error") -> ValidationError:
+    """
+    Shared ValidationError for messages that repeat across invoices (fixed
+    warnings, invalid currency codes). Only safe because the model is frozen.
+    """
+    return _err(rule, message, severity)
+
+
+@dataclass
+class ValidationContext:
+    """
+    Per-run state for one validate_batch call (or a series of
+    validate_invoice calls that should share duplicate tracking).
+
+    Keeping it out of InvoiceValidator means one validator instance can
+    serve concurrent requests without them clobbering each other's state.
+    """
+
+    # duplicate keys seen so far in this run
+    seen: Set[tuple] = field(default_factory=set)
+    # reference date for the date rules
+    today: date = field(default_factory=date.today)
+    # running totals kept by iter_validate, for summary()
+    total: int = 0
+    valid: int = 0
+    error_counts: Counter = field(default_factory=Counter)
+
+    def remember(self, key: tuple) -> None:
+        """Track a key for duplicate detection."""
+        self.seen.add(key)
+
+    def summary(self) -> ValidationSummary:
+        """Summary of the invoices validated with this context so far."""
+        return ValidationSummary(
+            total_invoices=self.total,
+            valid_invoices=self.valid,
+            invalid_invoices=self.total - self.valid,
+            error_counts=dict(self.error_counts),
+        )
+
+
+class RuleCheck(NamedTuple):
+    """Metadata for one rule check, used to order checks in fast-fail mode."""
+
+    method: str  # name of the InvoiceValidator method
+    cost: float  # rough relative cost per invoice
+    fail_prob: float  # expected share of invoices failing this check
+    rules: Tuple[str, ...]  # rule ids the check can report
+
 
 class InvoiceValidator:
     """
@@ -33,7 +122,7 @@ class InvoiceValidator:
     - anomaly: duplicate invoices, negative amounts
     """
 
-    REQUIRED_FIELDS = [
+    REQUIRED_FIELDS = (
         "invoice_number",
         "invoice_date",
         "seller_name",
@@ -42,72 +131,240 @@ class InvoiceValidator:
         "net_total",
         "tax_amount",
         "gross_total",
-    ]
+    )
+
+    # (field, missing error, empty error) per required field. The messages
+    # never change, so the errors are built once and shared (they're frozen).
+    # Only str-typed fields can be blank, so the others get no empty error
+    # and skip the strip() check.
+    _REQUIRED_FIELD_CHECKS = tuple(
+        (
+            field_name,
+            _err("required_field_missing", f"Missing required field: {field_name}"),
+            _err("required_field_empty", f"Required field is empty: {field_name}")
+            if _is_str_field(field_name)
+            else None,
+        )
+        for field_name in REQUIRED_FIELDS
+    )
+
+    # All rule checks in reporting order. cost / fail_prob are starting
+    # estimates; calibrate() replaces fail_prob with observed rates.
+    CHECKS = (
+        RuleCheck("_check_required_fields", 8, 0.05,
+                  ("required_field_missing", "required_field_empty")),
+        RuleCheck("_check_dates", 2, 0.02, ("invalid_date_format", "date_out_of_range")),
+        RuleCheck("_check_currency", 1, 0.01, ("invalid_currency",)),
+        RuleCheck("_check_line_items_sum", 4, 0.10, ("line_items_sum_mismatch",)),
+        RuleCheck("_check_gross_calculation", 1, 0.10, ("gross_calculation_mismatch",)),
+        RuleCheck("_check_due_date", 1, 0.03, ("due_date_before_invoice_date",)),
+        RuleCheck("_check_duplicates", 2, 0.02, ("duplicate_invoice",)),
+        RuleCheck("_check_non_negative", 3, 0.01,
+                  ("negative_amount", "negative_quantity", "negative_unit_price")),
+    )
+
+    def __init__(self, deterministic_order: bool = False) -> None:
+        # Only configuration lives on the instance; per-run state goes in a
+        # ValidationContext, so one validator can be shared between requests.
+
+        # If set, fast-fail runs keep the reporting order instead of cost order
+        self.deterministic_order = deterministic_order
+
+        # Bound checks in reporting order, used for full runs
+        self.checks = [getattr(self, c.method) for c in self.CHECKS]
+
+        # Same checks ordered cheapest / most likely to fail first, for fast-fail runs
+        self.fail_probs: Dict[str, float] = {c.method: c.fail_prob for c in self.CHECKS}
+        self.fast_fail_checks = self._order_by_cost()
+
+    # ------------------------------------------------------------------
+    # Check ordering
+    # ------------------------------------------------------------------
+    def _order_by_cost(self) -> list:
+        """Sort checks by cost / failure probability (lowest first)."""
+        ordered = sorted(
+            self.CHECKS,
+            key=lambda c: c.cost / max(self.fail_probs[c.method], 1e-3),
+        )
+        return [getattr(self, c.method) for c in ordered]
+
+    def calibrate(self, results: List[ValidationResult]) -> None:
+        """
+        Update failure probabilities from a previous (full, not fast-fail) run
+        and re-sort the fast-fail order accordingly.
+        """
+        if not results:
+            return
+
+        for c in self.CHECKS:
+            failed = sum(
+                1 for r in results if any(e.rule in c.rules for e in r.errors)
+            )
+            self.fail_probs[c.method] = failed / len(results)
 
-    def __init__(self) -> None:
-        # Used to track duplicates during a single batch run
-        self.seen_invoices: set = set()
+        self.fast_fail_checks = self._order_by_cost()
 
     # ------------------------------------------------------------------
     # Batch validation
     # ------------------------------------------------------------------
-    def validate_batch(self, invoices: List[Invoice]) -> Dict:
-        """Validate multiple invoices and return per-invoice results + a summary."""
-
-        results: List[ValidationResult] = []
-        error_counts = defaultdict(int)
+    def validate_batch(
+        self,
+        invoices: List[Invoice],
+        fast_fail: bool = False,
+        workers: Optional[int] = 1,
+    ) -> Dict:
+        """
+        Validate multiple invoices and return per-invoice results + a summary.
+
+        With fast_fail=True each invoice stops at the first failing check
+        (see validate_invoice), which is much cheaper for error-heavy batches.
+
+        By default everything runs in this process. With workers > 1,
+        batches over PARALLEL_THRESHOLD invoices are split into chunks and
+        validated on a process pool instead (workers=None: one per CPU).
+        Pickling invoices and results usually costs more than the checks
+        themselves, so only opt in when the per-invoice work is expensive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # fresh per-run state; one clock read for the whole batch also keeps
+        # date rules consistent across it
+        ctx = ValidationContext()
+
+        if workers > 1 and len(invoices) > PARALLEL_THRESHOLD:
+            results, error_counts = self._validate_parallel(
+                invoices, fast_fail, ctx.today, workers
+            )
+            valid_count = sum(1 for r in results if r.is_valid)
 
-        # reset duplicate tracking for each batch
-        self.seen_invoices.clear()
+            summary = ValidationSummary(
+                total_invoices=len(invoices),
+                valid_invoices=valid_count,
+                invalid_invoices=len(invoices) - valid_count,
+                error_counts=dict(error_counts),
+            )
+        else:
+            results = list(self.iter_validate(invoices, fast_fail=fast_fail, ctx=ctx))
+            summary = ctx.summary()
 
-        for inv in invoices:
-            result = self.validate_invoice(inv)
-            results.append(result)
+        return {"results": results, "summary": summary}
 
-            for err in result.errors:
-                error_counts[err.rule] += 1
+    def iter_validate(
+        self,
+        invoices: List[Invoice],
+        fast_fail: bool = False,
+        ctx: Optional[ValidationContext] = None,
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate invoices in order in this process, yielding each result as
+        soon as it's ready (e.g. to stream a response without holding all
+        results in memory).
+
+        Running totals are kept in `ctx`; call ctx.summary() once the
+        iterator is exhausted. Keys already in ctx.seen (e.g. seeded by
+        earlier chunks) count as seen for duplicate detection.
+        """
+        if ctx is None:
+            ctx = ValidationContext()
 
-        valid_count = sum(1 for r in results if r.is_valid)
+        for inv in invoices:
+            result = self.validate_invoice(inv, fast_fail=fast_fail, ctx=ctx)
 
-        summary = ValidationSummary(
-            total_invoices=len(invoices),
-            valid_invoices=valid_count,
-            invalid_invoices=len(invoices) - valid_count,
-            error_counts=dict(error_counts),
-            validation_timestamp=datetime.utcnow(),
-        )
+            ctx.total += 1
+            if result.is_valid:
+                ctx.valid += 1
+            else:
+                ctx.error_counts.update(err.rule for err in result.errors)
+
+            yield result
+
+    def _validate_parallel(
+        self, invoices: List[Invoice], fast_fail: bool, today: date, workers: int
+    ) -> Tuple[List[ValidationResult], Dict[str, int]]:
+        """Validate chunks of the batch on a process pool, keeping input order."""
+        chunk_size = max(MIN_CHUNK_SIZE, len(invoices) // (workers * 4))
+        chunks = [
+            invoices[i : i + chunk_size] for i in range(0, len(invoices), chunk_size)
+        ]
+
+        # Only keys that occur more than once can be duplicates, so those are
+        # the only ones each chunk needs to know about from earlier chunks.
+        keys = [self.duplicate_key(inv) for inv in invoices]
+        repeated = {key for key, count in Counter(keys).items() if count > 1}
+
+        seeds: List[FrozenSet[tuple]] = []
+        seen: set = set()
+        for start in range(0, len(keys), chunk_size):
+            seeds.append(frozenset(seen))
+            seen.update(key for key in keys[start : start + chunk_size] if key in repeated)
+
+        n = len(chunks)
+        config = (self.deterministic_order, self.fail_probs)
+        results: List[ValidationResult] = []
+        error_counts: Counter = Counter()
+
+        with ProcessPoolExecutor(max_workers=min(workers, n)) as executor:
+            chunk_iter = executor.map(
+                _validate_chunk,
+                repeat(config, n),
+                chunks,
+                seeds,
+                repeat(fast_fail, n),
+                repeat(today, n),
+            )
+            for chunk_results, chunk_counts in chunk_iter:
+                results.extend(chunk_results)
+                error_counts.update(chunk_counts)
 
-        return {"results": results, "summary": summary}
+        return results, error_counts
 
     # ------------------------------------------------------------------
     # Single invoice validation
     # ------------------------------------------------------------------
-    def validate_invoice(self, invoice: Invoice) -> ValidationResult:
-        """Run all checks for one invoice."""
+    def validate_invoice(
+        self,
+        invoice: Invoice,
+        fast_fail: bool = False,
+        ctx: Optional[ValidationContext] = None,
+    ) -> ValidationResult:
+        """
+        Run all checks for one invoice.
+
+        `ctx` holds the run state (duplicate tracking, reference date);
+        validate_batch passes one for the whole batch. Without it the
+        invoice is checked on its own, against today's date.
+
+        With fast_fail=True, stop after the first check that reports errors:
+        the invoice is invalid either way, so the remaining checks are skipped.
+        Fast-fail runs try cheap / likely-to-fail checks first unless the
+        validator was created with deterministic_order=True.
+        """
 
         errors: List[ValidationError] = []
         warnings: List[ValidationError] = []
 
-        # Completeness
-        errors.extend(self._check_required_fields(invoice))
-        errors.extend(self._check_dates(invoice))
-        errors.extend(self._check_currency(invoice))
+        if ctx is None:
+            ctx = ValidationContext()
 
-        # Business
-        errors.extend(self._check_line_items_sum(invoice))
-        errors.extend(self._check_gross_calculation(invoice))
-        errors.extend(self._check_due_date(invoice))
+        checks = self.checks
+        if fast_fail and not self.deterministic_order:
+            checks = self.fast_fail_checks
 
-        # Anomaly
-        errors.extend(self._check_duplicates(invoice))
-        errors.extend(self._check_non_negative(invoice))
+        for check in checks:
+            errors.extend(check(invoice, ctx))
+            if errors and fast_fail:
+                # still remember this invoice so later copies are flagged as duplicates
+                ctx.remember(self.duplicate_key(invoice))
+                break
 
         # Non-blocking warnings
-        warnings.extend(self._check_warnings(invoice))
+        warnings.extend(self._check_warnings(invoice, ctx))
 
         invoice_id = invoice.invoice_number or "UNKNOWN"
 
-        return ValidationResult(
+        # errors / warnings come from _err, so skip re-validating them
+        return ValidationResult.model_construct(
             invoice_id=invoice_id,
             is_valid=len(errors) == 0,
             errors=errors,
@@ -117,33 +374,27 @@ class InvoiceValidator:
     # ------------------------------------------------------------------
     # Individual rule implementations
     # ------------------------------------------------------------------
-    def _check_required_fields(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_required_fields(
+        self, invoice: Invoice, ctx: ValidationContext
+    ) -> List[ValidationError]:
         """Required fields must be present and non-empty."""
         errors: List[ValidationError] = []
 
-        for field_name in self.REQUIRED_FIELDS:
-            value = getattr(invoice, field_name, None)
+        # field values live in the instance __dict__; .get() also treats a
+        # field left unset (e.g. model_construct) as missing
+        values = invoice.__dict__
+
+        for field_name, missing_error, empty_error in self._REQUIRED_FIELD_CHECKS:
+            value = values.get(field_name)
 
             if value is None:
-                errors.append(
-                    ValidationError(
-                        rule="required_field_missing",
-                        message=f"Missing required field: {field_name}",
-                        severity="error",
-                    )
-                )
-            elif isinstance(value, str) and not value.strip():
-                errors.append(
-                    ValidationError(
-                        rule="required_field_empty",
-                        message=f"Required field is empty: {field_name}",
-                        severity="error",
-                    )
-                )
+                errors.append(missing_error)
+            elif empty_error is not None and not value.strip():
+                errors.append(empty_error)
 
         return errors
 
-    def _check_dates(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_dates(self, invoice: Invoice, ctx: ValidationContext) -> List[ValidationError]:
         """Basic date format and range checks."""
         errors: List[ValidationError] = []
 
@@ -151,18 +402,17 @@ class InvoiceValidator:
         if invoice.invoice_date:
             if not isinstance(invoice.invoice_date, date):
                 errors.append(
-                    ValidationError(
+                    _err(
                         rule="invalid_date_format",
                         message=f"invoice_date has invalid type/value: {invoice.invoice_date}",
                         severity="error",
                     )
                 )
             else:
-                today = date.today()
                 # simple sanity check: not more than ~10 years away from today
-                if abs((today - invoice.invoice_date).days) > 3650:
+                if abs((ctx.today - invoice.invoice_date).days) > 3650:
                     errors.append(
-                        ValidationError(
+                        _err(
                             rule="date_out_of_range",
                             message=f"invoice_date looks unrealistic: {invoice.invoice_date}",
                             severity="error",
@@ -172,7 +422,7 @@ class InvoiceValidator:
         # due_date checks
         if invoice.due_date and not isinstance(invoice.due_date, date):
             errors.append(
-                ValidationError(
+                _err(
                     rule="invalid_date_format",
                     message=f"due_date has invalid type/value: {invoice.due_date}",
                     severity="error",
@@ -181,25 +431,24 @@ class InvoiceValidator:
 
         return errors
 
-    def _check_currency(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_currency(self, invoice: Invoice, ctx: ValidationContext) -> List[ValidationError]:
         """Currency must be part of the Currency enum."""
-        from .models import Currency
-
         errors: List[ValidationError] = []
-        allowed = [c.value for c in Currency]
 
-        if invoice.currency not in allowed:
+        if invoice.currency not in _ALLOWED_CURRENCIES:
             errors.append(
-                ValidationError(
+                _mk_err(
                     rule="invalid_currency",
-                    message=f"Currency '{invoice.currency}' is not in {allowed}",
+                    message=f"Currency '{invoice.currency}' is not in {_CURRENCY_VALUES}",
                     severity="error",
                 )
             )
 
         return errors
 
-    def _check_line_items_sum(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_line_items_sum(
+        self, invoice: Invoice, ctx: ValidationContext
+    ) -> List[ValidationError]:
         """Sum of line items should roughly match net_total (with a tolerance)."""
         errors: List[ValidationError] = []
 
@@ -207,13 +456,17 @@ class InvoiceValidator:
             # No line items → nothing to validate here
             return errors
 
-        computed_sum = sum(item.line_total for item in invoice.line_items)
-        tolerance = invoice.net_total * 0.01  # 1% tolerance
-        diff = abs(computed_sum - invoice.net_total)
+        # Compare in integer cents: exact, and the 1% tolerance
+        # (diff > net_total * 0.01) needs no float math
+        net_cents = to_cents(invoice.net_total)
+        line_cents = sum(map(to_cents, map(_GET_LINE_TOTAL, invoice.line_items)))
+        diff_cents = abs(line_cents - net_cents)
 
-        if diff > tolerance:
+        if diff_cents and diff_cents * 100 > net_cents:
+            computed_sum = invoice.line_items_total
+            diff = abs(computed_sum - invoice.net_total)
             errors.append(
-                ValidationError(
+                _err(
                     rule="line_items_sum_mismatch",
                     message=(
                         f"Line items total {computed_sum:.2f} does not match "
@@ -225,17 +478,21 @@ class InvoiceValidator:
 
         return errors
 
-    def _check_gross_calculation(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_gross_calculation(
+        self, invoice: Invoice, ctx: ValidationContext
+    ) -> List[ValidationError]:
         """net_total + tax_amount should be close to gross_total."""
         errors: List[ValidationError] = []
 
-        expected_gross = invoice.net_total + invoice.tax_amount
-        tolerance = invoice.gross_total * 0.005  # 0.5%
-        diff = abs(expected_gross - invoice.gross_total)
+        # Compare in integer cents: exact, and the 0.5% tolerance
+        # (diff > gross_total * 0.005) needs no float math
+        gross_cents = to_cents(invoice.gross_total)
+        diff_cents = abs(to_cents(invoice.net_total) + to_cents(invoice.tax_amount) - gross_cents)
 
-        if diff > tolerance:
+        if diff_cents and diff_cents * 200 > gross_cents:
+            expected_gross = invoice.net_total + invoice.tax_amount
             errors.append(
-                ValidationError(
+                _err(
                     rule="gross_calculation_mismatch",
                     message=(
                         f"net_total ({invoice.net_total:.2f}) + tax_amount "
@@ -248,14 +505,14 @@ class InvoiceValidator:
 
         return errors
 
-    def _check_due_date(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_due_date(self, invoice: Invoice, ctx: ValidationContext) -> List[ValidationError]:
         """due_date should not be earlier than invoice_date."""
         errors: List[ValidationError] = []
 
         if invoice.due_date and invoice.invoice_date:
             if invoice.due_date < invoice.invoice_date:
                 errors.append(
-                    ValidationError(
+                    _err(
                         rule="due_date_before_invoice_date",
                         message=(
                             f"due_date ({invoice.due_date}) is before "
@@ -267,15 +524,20 @@ class InvoiceValidator:
 
         return errors
 
-    def _check_duplicates(self, invoice: Invoice) -> List[ValidationError]:
+    @staticmethod
+    def duplicate_key(invoice: Invoice) -> tuple:
+        """Identity used for duplicate detection: number + seller + date."""
+        return (invoice.invoice_number, invoice.seller_name, str(invoice.invoice_date))
+
+    def _check_duplicates(self, invoice: Invoice, ctx: ValidationContext) -> List[ValidationError]:
         """Detects duplicates within this validation run."""
         errors: List[ValidationError] = []
 
-        key = (invoice.invoice_number, invoice.seller_name, str(invoice.invoice_date))
+        key = self.duplicate_key(invoice)
 
-        if key in self.seen_invoices:
+        if key in ctx.seen:
             errors.append(
-                ValidationError(
+                _err(
                     rule="duplicate_invoice",
                     message=(
                         f"Duplicate invoice detected: {invoice.invoice_number} "
@@ -285,14 +547,24 @@ class InvoiceValidator:
                 )
             )
         else:
-            self.seen_invoices.add(key)
+            ctx.seen.add(key)
 
         return errors
 
-    def _check_non_negative(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_non_negative(
+        self, invoice: Invoice, ctx: ValidationContext
+    ) -> List[ValidationError]:
         """All monetary and quantity fields should be >= 0."""
         errors: List[ValidationError] = []
 
+        # Common case: nothing negative. One C-level min() for the totals and
+        # an any() that stops at the first negative line decide that without
+        # touching the detailed checks below.
+        if min(invoice.net_total, invoice.tax_amount, invoice.gross_total) >= 0 and not any(
+            item.quantity < 0 or item.unit_price < 0 for item in invoice.line_items
+        ):
+            return errors
+
         amount_fields = {
             "net_total": invoice.net_total,
             "tax_amount": invoice.tax_amount,
@@ -302,7 +574,7 @@ class InvoiceValidator:
         for name, value in amount_fields.items():
             if value < 0:
                 errors.append(
-                    ValidationError(
+                    _err(
                         rule="negative_amount",
                         message=f"{name} cannot be negative (value: {value})",
                         severity="error",
@@ -312,7 +584,7 @@ class InvoiceValidator:
         for idx, item in enumerate(invoice.line_items):
             if item.quantity < 0:
                 errors.append(
-                    ValidationError(
+                    _err(
                         rule="negative_quantity",
                         message=f"Line item {idx + 1} has negative quantity: {item.quantity}",
                         severity="error",
@@ -320,7 +592,7 @@ class InvoiceValidator:
                 )
             if item.unit_price < 0:
                 errors.append(
-                    ValidationError(
+                    _err(
                         rule="negative_unit_price",
                         message=f"Line item {idx + 1} has negative unit_price: {item.unit_price}",
                         severity="error",
@@ -332,13 +604,13 @@ class InvoiceValidator:
     # ------------------------------------------------------------------
     # Warnings only (non-blocking)
     # ------------------------------------------------------------------
-    def _check_warnings(self, invoice: Invoice) -> List[ValidationError]:
+    def _check_warnings(self, invoice: Invoice, ctx: ValidationContext) -> List[ValidationError]:
         """Extra checks that produce warnings, not hard errors."""
         warnings: List[ValidationError] = []
 
         if not invoice.line_items:
             warnings.append(
-                ValidationError(
+                _mk_err(
                     rule="no_line_items",
                     message="Invoice has no line items",
                     severity="warning",
@@ -347,7 +619,7 @@ class InvoiceValidator:
 
         if not invoice.seller_tax_id:
             warnings.append(
-                ValidationError(
+                _mk_err(
                     rule="missing_seller_tax_id",
                     message="Seller tax ID is missing",
                     severity="warning",
@@ -356,7 +628,7 @@ class InvoiceValidator:
 
         if not invoice.due_date:
             warnings.append(
-                ValidationError(
+                _mk_err(
                     rule="missing_due_date",
                     message="Due date is missing",
                     severity="warning",
@@ -364,10 +636,10 @@ class InvoiceValidator:
             )
 
         if invoice.invoice_date and isinstance(invoice.invoice_date, date):
-            age_days = (date.today() - invoice.invoice_date).days
+            age_days = (ctx.today - invoice.invoice_date).days
             if age_days > 365:
                 warnings.append(
-                    ValidationError(
+                    _err(
                         rule="old_invoice",
                         message=f"Invoice is {age_days} days old (over 1 year)",
                         severity="warning",
@@ -375,3 +647,29 @@ class InvoiceValidator:
                 )
 
         return warnings
+
+
+def _validate_chunk(
+    config: Tuple[bool, Dict[str, float]],
+    chunk: List[Invoice],
+    seen_keys: FrozenSet[tuple],
+    fast_fail: bool,
+    today: date,
+) -> Tuple[List[ValidationResult], Dict[str, int]]:
+    """
+    Process-pool worker for InvoiceValidator.validate_batch.
+
+    config carries the parent's deterministic_order and fail_probs so the
+    fast-fail order matches. seen_keys are duplicate keys already used by
+    earlier chunks, so duplicates across a chunk boundary are still flagged.
+    """
+    deterministic_order, fail_probs = config
+
+    validator = InvoiceValidator(deterministic_order=deterministic_order)
+    validator.fail_probs.update(fail_probs)
+    validator.fast_fail_checks = validator._order_by_cost()
+    ctx = ValidationContext(seen=set(seen_keys), today=today)
+
+    results = list(validator.iter_validate(chunk, fast_fail=fast_fail, ctx=ctx))
+    return results, dict(ctx.error_counts)
+
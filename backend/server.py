@@ -7,19 +7,26 @@ Main endpoints:
 - POST /extract-and-validate  → (optional) upload PDFs, extract + validate in one go
 """
 
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 from datetime import datetime
 from pathlib import Path
+import asyncio
 import tempfile
-import shutil
 import logging
+import os
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import aiofiles
+from pydantic import ValidationError as PydanticValidationError
+from pydantic_core import to_json
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
-from invoice_qc.models import Invoice
-from invoice_qc.validator import InvoiceValidator
+from invoice_qc.models import INVOICE_LIST_ADAPTER, Invoice
+from invoice_qc.validator import InvoiceValidator, ValidationContext
 from invoice_qc.extractor import PDFInvoiceExtractor
 
 # basic logging for debugging
@@ -30,6 +37,8 @@ app = FastAPI(
     title="Invoice QC API",
     description="Simple service to validate invoice JSON and (optionally) extract from PDFs",
     version="1.0.0",
+    # orjson instead of the stdlib encoder for plain dict responses
+    default_response_class=ORJSONResponse,
 )
 
 # CORS – open for assignment/demo purposes
@@ -44,6 +53,13 @@ app.add_middleware(
 validator = InvoiceValidator()
 extractor = PDFInvoiceExtractor()
 
+# Max PDFs extracted at the same time per request (pdfplumber is CPU-bound)
+_EXTRACT_SLOTS = os.cpu_count() or 1
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Validation results serialized per streamed chunk in /validate-json
+_STREAM_BATCH_SIZE = 256
+
 
 # ----------------------------------------------------------------------
 # Basic endpoints
@@ -76,35 +92,90 @@ async def health():
 # ----------------------------------------------------------------------
 # JSON validation
 # ----------------------------------------------------------------------
-@app.post("/validate-json")
-async def validate_json(invoices: List[Invoice]):
+# Request body schema for /docs; the nested models go into the OpenAPI
+# components so the $refs resolve
+_INVOICE_LIST_SCHEMA = INVOICE_LIST_ADAPTER.json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_INVOICE_SCHEMA_DEFS = _INVOICE_LIST_SCHEMA.pop("$defs", {})
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(_INVOICE_SCHEMA_DEFS)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
+def _stream_report(invoices: List[Invoice], fast_fail: bool) -> Iterator[bytes]:
+    """
+    Validate invoices and yield the {"results": [...], "summary": {...}}
+    report as JSON chunks while going, so the full results list is never
+    held in memory. Results are sent in batches to keep per-chunk overhead
+    low; the summary comes last, once the running totals are complete.
+    """
+    ctx = ValidationContext()
+    results = validator.iter_validate(invoices, fast_fail=fast_fail, ctx=ctx)
+
+    yield b'{"results":['
+    sep = b""
+    while batch := list(islice(results, _STREAM_BATCH_SIZE)):
+        yield sep + b",".join(map(to_json, batch))
+        sep = b","
+    yield b'],"summary":' + to_json(ctx.summary()) + b"}"
+
+
+@app.post(
+    "/validate-json",
+    response_model=None,
+    # the body is parsed by hand below, so describe it for /docs explicitly
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _INVOICE_LIST_SCHEMA}},
+            "required": True,
+        }
+    },
+)
+async def validate_json(request: Request, fast_fail: bool = False):
     """
     Validate one or more invoices passed as JSON.
 
     Request body: list of Invoice objects
+    Query: ?fast_fail=1 stops each invoice at its first failing check
+    (faster, but only the first error per invoice is reported)
     Response:
       {
         "results": [...],
         "summary": {...}
       }
     """
+    # Parse the raw body with the prebuilt List[Invoice] adapter instead of
+    # FastAPI's body handling; errors keep FastAPI's usual 422 shape
     try:
-        logger.info("Validating %d invoices", len(invoices))
-        result = validator.validate_batch(invoices)
+        invoices = INVOICE_LIST_ADAPTER.validate_json(await request.body())
+    except PydanticValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        )
 
-        return {
-            "results": [r.model_dump(mode="json") for r in result["results"]],
-            "summary": result["summary"].model_dump(mode="json"),
-        }
-    except Exception as exc:
-        logger.exception("Validation failed")
-        raise HTTPException(status_code=400, detail=str(exc))
+    logger.info("Validating %d invoices", len(invoices))
+
+    # Streamed: results are validated and serialized chunk by chunk (the sync
+    # generator runs in Starlette's thread pool, off the event loop)
+    return StreamingResponse(
+        _stream_report(invoices, fast_fail), media_type="application/json"
+    )
 
 
 # ----------------------------------------------------------------------
 # Optional: PDF upload → extract + validate
 # ----------------------------------------------------------------------
-@app.post("/extract-and-validate-pdfs")
+@app.post("/extract-and-validate-pdfs", response_model=None)
 async def extract_and_validate_pdfs(files: List[UploadFile] = File(...)):
     """
     Upload one or more PDF files, extract invoice data and run validation.
@@ -122,23 +193,51 @@ async def extract_and_validate_pdfs(files: List[UploadFile] = File(...)):
             )
 
     try:
-        invoices: List[Invoice] = []
-
         # Use a temp directory for saving the uploaded PDFs
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
+            slots = asyncio.Semaphore(_EXTRACT_SLOTS)
 
-            for upload in files:
-                dest = tmp_path / upload.filename
-                with dest.open("wb") as buffer:
-                    shutil.copyfileobj(upload.file, buffer)
+            async def handle(index: int, upload: UploadFile) -> Invoice:
+                # one sub-folder per upload so equal file names don't collide
+                dest_dir = tmp_path / str(index)
+                dest_dir.mkdir()
+                dest = dest_dir / Path(upload.filename).name
 
-                # extract a single invoice from this PDF
-                inv = extractor.extract(str(dest))
-                invoices.append(inv)
+                async with aiofiles.open(dest, "wb") as buffer:
+                    while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+                        await buffer.write(chunk)
 
-        # run validation on what we extracted
-        result = validator.validate_batch(invoices)
+                # extract a single invoice from this PDF, off the event loop
+                async with slots:
+                    extraction = asyncio.ensure_future(
+                        asyncio.to_thread(extractor.extract, str(dest))
+                    )
+                    try:
+                        return await asyncio.shield(extraction)
+                    except asyncio.CancelledError:
+                        # a thread can't be cancelled: let it finish before
+                        # the temp dir is removed under it
+                        await asyncio.wait({extraction})
+                        raise
+
+            # TaskGroup cancels the remaining uploads when one fails and only
+            # returns once every task is done, so nothing outlives tmp_dir
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(handle(i, upload))
+                        for i, upload in enumerate(files)
+                    ]
+            except ExceptionGroup as exc_group:
+                # report the first failure like a plain exception
+                raise exc_group.exceptions[0]
+
+            invoices: List[Invoice] = [task.result() for task in tasks]
+
+        # run validation on what we extracted (the validator keeps no
+        # per-run state, so sharing it across threads is safe)
+        result = await asyncio.to_thread(validator.validate_batch, invoices)
 
         return {
             "extracted": [inv.model_dump(mode="json") for inv in invoices],
@@ -171,3 +270,19 @@ async def global_exception_handler(request, exc):
             "timestamp": datetime.utcnow().isoformat(),
         },
     )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Production-style run: one worker process per CPU, uvloop event loop and
+    # httptools HTTP parser (both come with uvicorn[standard]).
+    # For development use `uvicorn server:app --reload` instead.
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 1,
+    )